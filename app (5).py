@@ -32,10 +32,16 @@ la clave `gcp_service_account`. Consulte la documentación de gspread
 para más detalles.
 """
 
+import csv
+import hashlib
+import io
 import os
+import re
 from typing import Dict
 
+import numpy as np
 import pandas as pd
+import requests
 import streamlit as st
 
 try:
@@ -58,23 +64,77 @@ SHEET_ID = "178qdDSPP7GV3eISXE8xeN9MQtvV3fFk5efY1DCc8Tqk"
 # GID de la pestaña "Reportes de falla V2"
 GID = "58710399"
 
+# Prefijos (en minúsculas) de las columnas de la hoja y nombre normalizado que
+# reciben. Ante varias coincidencias gana el primer prefijo de la lista.
+PREFIX_MAP = (
+    ('depart', 'departamento'),
+    ('fecha falla', 'fecha_falla'),
+    ('fecha de term', 'fecha_cierre'),
+    ('tipo de falla', 'tipo_de_falla'),
+    ('sistema', 'sistema'),
+    ('grupo', 'grupo_area'),
+    ('equipo', 'equipo'),
+    ('modelo equi', 'equipo'),
+    ('buque', 'buque'),
+    ('trabajo efectuado', 'trabajo_efectuado'),
+    ('descripcion de modo de falla', 'descripcion_modo_falla'),
+)
+# Un grupo por prefijo; `match.lastindex` indica la entrada de PREFIX_MAP
+PREFIX_RE = re.compile('|'.join(f'({re.escape(prefix)})' for prefix, _ in PREFIX_MAP))
+
+# Los gráficos de resumen no necesitan zoom ni tooltips: se dibujan estáticos
+# para evitar que plotly.js instale sus manejadores de interacción
+PLOTLY_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Figuras de plotly que se conservan en caché: 3 gráficos por buque para
+# varios buques y algunas versiones de la hoja. Las más antiguas se descartan.
+FIGURE_CACHE_ENTRIES = 3 * 20 * 3
+
+# Formato de fecha habitual de la hoja (configuración regional en español)
+DATE_FORMAT = '%d/%m/%Y'
+
+# Nanosegundos en un día, para calcular `dias_abierto`
+NS_PER_DAY = 86_400_000_000_000
+
+# Columnas de baja cardinalidad que se agrupan en el dashboard. Se almacenan
+# como 'category' para que los groupby operen sobre códigos enteros.
+CATEGORY_COLS = ['buque', 'departamento', 'equipo', 'sistema', 'tipo_de_falla', 'estado']
+
+
+def is_csv_with_rows(content_type: str, content: bytes) -> bool:
+    """Indica si la respuesta de exportación es un CSV con al menos una fila de datos.
+
+    Google puede responder 200 con una página HTML (p. ej. de inicio de
+    sesión) o con una exportación que sólo trae el encabezado; en ambos casos
+    se debe intentar la descarga mediante `gspread`.
+    """
+    if 'text/csv' not in content_type.lower() or not content:
+        return False
+    try:
+        return not pd.read_csv(io.BytesIO(content), nrows=1).empty
+    except Exception:
+        return False
+
 
 @st.cache_data(show_spinner=False)
-def load_data(sheet_id: str = SHEET_ID, gid: str = GID) -> pd.DataFrame:
-    """Carga los datos de la pestaña indicada del Google Sheet.
+def load_data(sheet_id: str = SHEET_ID, gid: str = GID) -> bytes:
+    """Descarga el contenido CSV de la pestaña indicada del Google Sheet.
 
     Intenta primero descargar los datos usando el enlace de exportación CSV de
     Google Sheets【723629888661203†L160-L176】. Si falla (por ejemplo, la hoja no
     es pública), se utilizará `gspread` con las credenciales de servicio
-    proporcionadas en `st.secrets`.
+    proporcionadas en `st.secrets` y los registros se serializan a CSV.
+
+    Se devuelven los bytes sin procesar para que el análisis y el
+    preprocesamiento se cacheen en `parse_and_preprocess` a partir de un
+    objeto barato de hashear.
 
     Args:
         sheet_id: ID del documento.
         gid: ID de la pestaña.
 
     Returns:
-        DataFrame con todos los registros de la pestaña o vacío si no se puede
-        cargar.
+        Contenido CSV de la pestaña o `b''` si no se puede cargar.
     """
     # Intento 1: descargar mediante CSV si la hoja es pública
     csv_url = (
@@ -82,12 +142,12 @@ def load_data(sheet_id: str = SHEET_ID, gid: str = GID) -> pd.DataFrame:
         f"&id={sheet_id}&gid={gid}"
     )
     try:
-        df = pd.read_csv(csv_url)
-        # Si carga con éxito y no está vacío, devolver
-        if not df.empty:
-            return df
+        response = requests.get(csv_url, timeout=10)
+        # Si es un CSV válido con al menos una fila de datos, devolver
+        if response.ok and is_csv_with_rows(response.headers.get('Content-Type', ''), response.content):
+            return response.content
     except Exception:
-        df = pd.DataFrame()
+        pass
 
     # Intento 2: usar gspread con credenciales de servicio
     if GSPREAD_AVAILABLE and 'gcp_service_account' in st.secrets:
@@ -102,15 +162,24 @@ def load_data(sheet_id: str = SHEET_ID, gid: str = GID) -> pd.DataFrame:
             spreadsheet = client.open_by_key(sheet_id)
             worksheet = spreadsheet.get_worksheet_by_id(int(gid))
             if worksheet is None:
-                return df
-            records = worksheet.get_all_records()
-            df = pd.DataFrame(records)
-            return df
+                return b''
+            # Una sola llamada a la API devuelve encabezado y valores juntos
+            response = spreadsheet.values_batch_get(
+                ranges=[gspread.utils.absolute_range_name(worksheet.title)]
+            )
+            values = response['valueRanges'][0].get('values', [])
+            if not values:
+                return b''
+            # Las filas pueden venir más largas que el encabezado; se recortan
+            width = len(values[0])
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(row[:width] for row in values)
+            return buffer.getvalue().encode('utf-8')
         except Exception:
             pass
 
-    # Fallback: devolver DataFrame vacío
-    return pd.DataFrame()
+    # Fallback: sin datos
+    return b''
 
 
 def preprocess(df: pd.DataFrame) -> pd.DataFrame:
@@ -130,67 +199,203 @@ def preprocess(df: pd.DataFrame) -> pd.DataFrame:
     """
     if df.empty:
         return df
+    # Texto como cadenas Arrow (búferes UTF-8 contiguos) en lugar de objetos
+    # Python; `parse_and_preprocess` ya las entrega así desde `read_csv`
+    str_cols = df.select_dtypes(include=['object'], exclude=['string']).columns
+    if len(str_cols):
+        df = df.astype({col: 'string[pyarrow]' for col in str_cols})
     # Normalizar nombres de columnas: minúsculas, reemplazar espacios por guiones bajos
-    df = df.rename(columns=lambda col: str(col).strip())
+    df = df.set_axis(df.columns.astype(str).str.strip(), axis=1)
     # Crear un diccionario de renombrado para columnas de interés
     rename_map = {}
     for col in df.columns:
-        col_lower = col.lower()
-        if col_lower.startswith('depart'):
-            rename_map[col] = 'departamento'
-        elif col_lower.startswith('fecha falla') or col_lower == 'fecha falla':
-            rename_map[col] = 'fecha_falla'
-        elif col_lower.startswith('fecha de term'):
-            rename_map[col] = 'fecha_cierre'
-        elif col_lower.startswith('tipo de falla'):
-            rename_map[col] = 'tipo_de_falla'
-        elif col_lower.startswith('sistema'):
-            rename_map[col] = 'sistema'
-        elif col_lower.startswith('grupo'):
-            rename_map[col] = 'grupo_area'
-        elif col_lower.startswith('equipo') or col_lower.startswith('modelo equi'):
-            rename_map[col] = 'equipo'
-        elif col_lower.startswith('buque'):
-            rename_map[col] = 'buque'
-        elif col_lower.startswith('trabajo efectuado'):
-            rename_map[col] = 'trabajo_efectuado'
-        elif col_lower.startswith('descripcion de modo de falla'):
-            rename_map[col] = 'descripcion_modo_falla'
+        match = PREFIX_RE.match(col.lower())
+        if match:
+            rename_map[col] = PREFIX_MAP[match.lastindex - 1][1]
     df = df.rename(columns=rename_map)
-    # Deduplicar nombres de columnas que se hayan renombrado a la misma clave
-    new_columns = []
-    col_counts = {}
-    for col in df.columns:
-        # Si ya existe el nombre, incrementar contador y agregar sufijo
-        if col in col_counts:
-            col_counts[col] += 1
-            new_columns.append(f"{col}_{col_counts[col]}")
-        else:
-            col_counts[col] = 1
-            new_columns.append(col)
-    df.columns = new_columns
-    # Convertir fechas si existen
+    # Deduplicar nombres de columnas que se hayan renombrado a la misma clave:
+    # la n-ésima repetición de un nombre recibe el sufijo `_n`
+    names = pd.Series(df.columns, dtype=object)
+    if names.duplicated().any():
+        ocurrencia = names.groupby(names, sort=False).cumcount().add(1).astype(str)
+        df.columns = np.where(names.duplicated(), names + '_' + ocurrencia, names)
+    # Convertir fechas si existen. Primero se usa el formato fijo de la hoja
+    # (ruta rápida en C), luego ISO 8601 (que `dayfirst` leería como año-día-mes)
+    # y sólo lo que queda pasa por el parser general, convirtiendo una vez cada
+    # valor distinto (`cache=True`).
     for date_col in ['fecha_falla', 'fecha_cierre']:
         if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col], errors='coerce', dayfirst=True)
-    # Calcular estado
-    def determinar_estado(row):
-        # Cerrado si existe fecha de cierre
-        if 'fecha_cierre' in row and pd.notna(row['fecha_cierre']):
-            return 'Cerrado'
-        # Cierre de nave si el trabajo fue realizado por la nave
-        trabajo = str(row.get('trabajo_efectuado', '')).strip().lower()
-        if trabajo in ['nave', 'nave ']:
-            return 'Cierre Nave'
-        return 'Abierto'
-    df['estado'] = df.apply(determinar_estado, axis=1)
-    # Días abiertos: para reportes abiertos se calcula diferencia con hoy
+            valores = df[date_col]
+            fechas = pd.to_datetime(valores, format=DATE_FORMAT, errors='coerce')
+            pendientes = fechas.isna() & valores.notna()
+            if pendientes.any():
+                fechas[pendientes] = pd.to_datetime(
+                    valores[pendientes], format='ISO8601', errors='coerce'
+                )
+                pendientes = fechas.isna() & valores.notna()
+            if pendientes.any():
+                fechas[pendientes] = pd.to_datetime(
+                    valores[pendientes], errors='coerce', dayfirst=True, format='mixed', cache=True
+                )
+            df[date_col] = fechas
+    # Calcular estado de forma vectorizada: cerrado si existe fecha de cierre,
+    # cierre de nave si el trabajo fue realizado por la nave y abierto en otro caso
+    if 'fecha_cierre' in df.columns:
+        cerrado_mask = df['fecha_cierre'].notna()
+    else:
+        cerrado_mask = pd.Series(False, index=df.index)
+    trabajo_lower = (
+        df.get('trabajo_efectuado', pd.Series('', index=df.index))
+        .astype('string')
+        .str.strip()
+        .str.casefold()
+    )
+    nave_mask = trabajo_lower.eq('nave').fillna(False).astype(bool)
+    df['estado'] = np.select(
+        [cerrado_mask.to_numpy(), nave_mask.to_numpy()],
+        ['Cerrado', 'Cierre Nave'],
+        default='Abierto',
+    )
+    # Días abiertos: para reportes abiertos se calcula diferencia con hoy en
+    # días completos (redondeando hacia abajo). Se opera en nanosegundos int64
+    # y se guarda como Int32 con máscara para las fechas faltantes.
     if 'fecha_falla' in df.columns:
-        hoy = pd.Timestamp.today().normalize()
-        df['dias_abierto'] = (hoy - df['fecha_falla']).dt.days
+        fechas_falla = df['fecha_falla'].to_numpy(dtype='datetime64[ns]')
+        faltantes = np.isnat(fechas_falla)
+        hoy_ns = pd.Timestamp.today().normalize().value
+        # Reemplazar NaT antes de restar para no desbordar int64
+        fechas_ns = np.where(faltantes, hoy_ns, fechas_falla.view('int64'))
+        dias = ((hoy_ns - fechas_ns) // NS_PER_DAY).astype('int32')
+        df['dias_abierto'] = pd.arrays.IntegerArray(dias, faltantes)
+    # Convertir columnas de agrupación a 'category'. Se pasa por `object` para
+    # que las categorías no hereden el backend pyarrow: sus nulos (pd.NA) no
+    # son compatibles con plotly.
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype(object).astype('category')
     return df
 
 
+@st.cache_data(show_spinner=False)
+def parse_and_preprocess(raw: bytes) -> pd.DataFrame:
+    """Interpreta el CSV descargado y aplica `preprocess`.
+
+    El resultado se cachea a partir de los bytes crudos, que Streamlit usa
+    directamente como clave sin hashear el DataFrame procesado, por lo que
+    las reejecuciones del script (cada interacción con un widget) no repiten
+    el análisis del CSV ni el cálculo de los campos auxiliares mientras la
+    hoja no cambie.
+
+    Args:
+        raw: Contenido CSV devuelto por `load_data`.
+
+    Returns:
+        DataFrame procesado o vacío si no hay datos.
+    """
+    if not raw:
+        return pd.DataFrame()
+    try:
+        # Leer sólo el encabezado para descartar las columnas que el dashboard
+        # no usa antes de analizar el resto del archivo
+        header = pd.read_csv(io.BytesIO(raw), nrows=0).columns
+        usecols = [
+            i for i, col in enumerate(header) if PREFIX_RE.match(str(col).strip().lower())
+        ]
+        df = pd.read_csv(
+            io.BytesIO(raw),
+            usecols=usecols or None,
+            dtype='string[pyarrow]' if usecols else None,
+            dtype_backend='pyarrow',
+        )
+    except Exception:
+        return pd.DataFrame()
+    return preprocess(df)
+
+
+def fleet_counts(df: pd.DataFrame, key: str, color: str) -> pd.Series:
+    """Cuenta reportes por (`buque`, `key`, `color`) para toda la flota.
+
+    Se calcula una sola vez antes de recorrer los buques; cada pestaña toma
+    su parte con `.loc[buque]`, que sólo recorre las filas de ese buque. Se
+    usa `groupby` con `observed=True` en lugar de `DataFrame.value_counts`,
+    ya que este último enumera todas las combinaciones de categorías,
+    incluidas las vacías.
+
+    Args:
+        df: DataFrame procesado con todos los buques.
+        key: Columna del eje x.
+        color: Columna usada para separar las barras.
+
+    Returns:
+        Serie de conteos con índice (`buque`, `key`, `color`).
+    """
+    return df.groupby(['buque', key, color], dropna=False, observed=True, sort=False).size()
+
+
+def top_counts(counts: pd.Series, n: int | None = 10) -> pd.DataFrame:
+    """Limita los conteos de un buque a los `n` valores más frecuentes del primer nivel.
+
+    Los totales por valor del eje x se obtienen de los propios conteos del
+    buque, sin volver a recorrer sus filas, y los `n` mayores se seleccionan
+    con `.loc` sobre el primer nivel del índice.
+
+    Args:
+        counts: Conteos del buque indexados por (eje x, columna de color),
+            tal como los devuelve `fleet_counts(...).loc[buque]`.
+        n: Cantidad de valores del eje x a conservar. Con None se conservan todos.
+
+    Returns:
+        DataFrame con las columnas del índice y `cantidad`.
+    """
+    if n is not None:
+        top = counts.groupby(level=0, observed=True).sum().nlargest(n).index
+        # Búsqueda por hash sobre el primer nivel del índice, sin recorrer los conteos
+        counts = counts.loc[(top, slice(None))]
+    return counts.reset_index(name='cantidad')
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_bar(counts_hash: str, _counts: pd.DataFrame, x: str, color: str, barmode: str, title: str):
+    """Construye la figura de barras; `_counts` no se hashea, la clave es `counts_hash`."""
+    return px.bar(_counts, x=x, y='cantidad', color=color, barmode=barmode, title=title)
+
+
+def bar_figure(counts: pd.DataFrame, x: str, color: str, barmode: str, title: str):
+    """Devuelve un gráfico de barras de plotly reutilizando figuras ya construidas.
+
+    Construir una figura con `px.bar` es lo más costoso de cada reejecución,
+    por lo que las figuras se guardan con `st.cache_resource` usando como
+    clave un hash del contenido de `counts` y los parámetros del gráfico.
+
+    Args:
+        counts: Tabla de frecuencias con la columna `cantidad`.
+        x: Columna del eje x.
+        color: Columna usada para separar las barras.
+        barmode: Modo de barras de plotly ('group' o 'stack').
+        title: Título del gráfico.
+
+    Returns:
+        Figura de plotly.
+    """
+    counts_hash = hashlib.sha1(
+        pd.util.hash_pandas_object(counts, index=False).to_numpy().tobytes()
+    ).hexdigest()
+    return _build_bar(counts_hash, counts, x, color, barmode, title)
+
+
+def show_open_reports(df_abierto: pd.DataFrame) -> None:
+    """Muestra la tabla de reportes de falla abiertos de un buque.
+
+    El ordenamiento y el desplazamiento de la tabla se resuelven en el
+    navegador, por lo que no provocan reejecuciones del script.
+    """
+    st.subheader('Reportes de falla abiertos')
+    try:
+        st.dataframe(df_abierto, use_container_width=True)
+    except Exception:
+        st.warning('No se pudo mostrar la tabla de reportes abiertos debido a un problema con los datos.')
+
+
 def draw_dashboard(df: pd.DataFrame) -> None:
     """Construye la interfaz del dashboard dado un DataFrame procesado.
 
@@ -226,38 +431,41 @@ def draw_dashboard(df: pd.DataFrame) -> None:
         st.error('No se encontraron datos de buques en la hoja.')
         return
 
+    # Seleccionar nombres de columnas definitivos para cada agrupación
+    departamento_col = pick_first_col('departamento', df)
+    estado_col = 'estado' if 'estado' in df.columns else None
+    equipo_col = pick_first_col('equipo', df)
+    tipo_col = pick_first_col('tipo_de_falla', df)
+    sistema_col = pick_first_col('sistema', df)
+
+    # Particionar el DataFrame por buque en una sola pasada
+    buque_groups = {k: g for k, g in df.groupby('buque', observed=True, sort=False)}
+
+    # Conteos de toda la flota: una pasada por gráfico en lugar de una por buque
+    agg_dept = fleet_counts(df, departamento_col, estado_col) if departamento_col and estado_col else None
+    agg_equipo = fleet_counts(df, equipo_col, tipo_col) if equipo_col and tipo_col else None
+    agg_sistema = fleet_counts(df, sistema_col, tipo_col) if sistema_col and tipo_col else None
+
     # Crear un tab por cada buque
     tabs = st.tabs([f"{buque}" for buque in buques])
     for buque, tab in zip(buques, tabs):
         with tab:
-            df_buque = df[df['buque'] == buque].copy()
+            df_buque = buque_groups.get(buque, df.iloc[0:0])
             st.subheader(f'Reportes de fallas: {buque}')
 
-            # Seleccionar nombres de columnas definitivos para cada agrupación
-            departamento_col = pick_first_col('departamento', df_buque)
-            estado_col = 'estado' if 'estado' in df_buque.columns else None
-            equipo_col = pick_first_col('equipo', df_buque)
-            tipo_col = pick_first_col('tipo_de_falla', df_buque)
-            sistema_col = pick_first_col('sistema', df_buque)
-
             # Distribución por departamento y estado
-            if departamento_col and estado_col:
+            if agg_dept is not None:
                 try:
-                    dept_counts = (
-                        df_buque.groupby([departamento_col, estado_col], dropna=False)
-                        .size()
-                        .reset_index(name='cantidad')
-                    )
+                    dept_counts = top_counts(agg_dept.loc[buque], n=None)
                     if PLOTLY_AVAILABLE and not dept_counts.empty:
-                        fig_dept = px.bar(
+                        fig_dept = bar_figure(
                             dept_counts,
                             x=departamento_col,
-                            y='cantidad',
                             color=estado_col,
                             barmode='group',
-                            title='Estado de reportes por departamento'
+                            title='Estado de reportes por departamento',
                         )
-                        st.plotly_chart(fig_dept, use_container_width=True)
+                        st.plotly_chart(fig_dept, use_container_width=True, config=PLOTLY_CONFIG)
                     else:
                         pivot = (
                             dept_counts.pivot(index=departamento_col, columns=estado_col, values='cantidad')
@@ -268,31 +476,19 @@ def draw_dashboard(df: pd.DataFrame) -> None:
                     st.warning('No se pudo generar el gráfico por departamento debido a un problema con los datos.')
 
             # Barras apiladas por equipo y tipo de falla
-            if equipo_col and tipo_col:
+            if agg_equipo is not None:
                 try:
-                    counts_equipo = (
-                        df_buque.groupby([equipo_col, tipo_col], dropna=False)
-                        .size()
-                        .reset_index(name='cantidad')
-                    )
                     # Para evitar gráficos interminables, mostrar sólo los 10 equipos con más fallas
-                    top_equipos = (
-                        counts_equipo.groupby(equipo_col)['cantidad']
-                        .sum()
-                        .nlargest(10)
-                        .index
-                    )
-                    counts_equipo_top = counts_equipo[counts_equipo[equipo_col].isin(top_equipos)]
+                    counts_equipo_top = top_counts(agg_equipo.loc[buque])
                     if PLOTLY_AVAILABLE and not counts_equipo_top.empty:
-                        fig_equipo = px.bar(
+                        fig_equipo = bar_figure(
                             counts_equipo_top,
                             x=equipo_col,
-                            y='cantidad',
                             color=tipo_col,
                             barmode='stack',
-                            title='Fallas por equipo y tipo de falla (top 10 equipos)'
+                            title='Fallas por equipo y tipo de falla (top 10 equipos)',
                         )
-                        st.plotly_chart(fig_equipo, use_container_width=True)
+                        st.plotly_chart(fig_equipo, use_container_width=True, config=PLOTLY_CONFIG)
                     else:
                         pivot = (
                             counts_equipo_top.pivot(index=equipo_col, columns=tipo_col, values='cantidad')
@@ -303,30 +499,18 @@ def draw_dashboard(df: pd.DataFrame) -> None:
                     st.warning('No se pudo generar el gráfico por equipo debido a un problema con los datos.')
 
             # Barras apiladas por sistema y tipo de falla
-            if sistema_col and tipo_col:
+            if agg_sistema is not None:
                 try:
-                    counts_sistema = (
-                        df_buque.groupby([sistema_col, tipo_col], dropna=False)
-                        .size()
-                        .reset_index(name='cantidad')
-                    )
-                    top_sistemas = (
-                        counts_sistema.groupby(sistema_col)['cantidad']
-                        .sum()
-                        .nlargest(10)
-                        .index
-                    )
-                    counts_sistema_top = counts_sistema[counts_sistema[sistema_col].isin(top_sistemas)]
+                    counts_sistema_top = top_counts(agg_sistema.loc[buque])
                     if PLOTLY_AVAILABLE and not counts_sistema_top.empty:
-                        fig_sistema = px.bar(
+                        fig_sistema = bar_figure(
                             counts_sistema_top,
                             x=sistema_col,
-                            y='cantidad',
                             color=tipo_col,
                             barmode='stack',
-                            title='Fallas por sistema y tipo de falla (top 10 sistemas)'
+                            title='Fallas por sistema y tipo de falla (top 10 sistemas)',
                         )
-                        st.plotly_chart(fig_sistema, use_container_width=True)
+                        st.plotly_chart(fig_sistema, use_container_width=True, config=PLOTLY_CONFIG)
                     else:
                         pivot = (
                             counts_sistema_top.pivot(index=sistema_col, columns=tipo_col, values='cantidad')
@@ -346,11 +530,13 @@ def draw_dashboard(df: pd.DataFrame) -> None:
                     if col_name:
                         cols.append(col_name)
                 if cols:
-                    st.subheader('Reportes de falla abiertos')
-                    try:
-                        st.dataframe(df_abierto[cols], use_container_width=True)
-                    except Exception:
-                        st.warning('No se pudo mostrar la tabla de reportes abiertos debido a un problema con los datos.')
+                    show_open_reports(df_abierto[cols])
+
+
+def clear_caches() -> None:
+    """Descarta los datos y las figuras cacheadas para forzar una recarga."""
+    st.cache_data.clear()
+    _build_bar.clear()
 
 
 def main() -> None:
@@ -363,13 +549,17 @@ def main() -> None:
         'real, edite la hoja en Google Sheets; los cambios se reflejarán al '
         'recargar esta página.'
     )
-    # Botón para forzar recarga de datos
-    if st.button('Recargar datos', help='Refresca los datos desde Google Sheets'):
-        st.cache_data.clear()
-    df_raw = load_data()
-    df_processed = preprocess(df_raw)
+    # Botón para forzar recarga de datos. Las cachés se limpian en el callback,
+    # que Streamlit ejecuta antes de volver a correr el script.
+    st.button(
+        'Recargar datos',
+        help='Refresca los datos desde Google Sheets',
+        on_click=clear_caches,
+    )
+    with st.spinner('Cargando datos desde Google Sheets...'):
+        df_processed = parse_and_preprocess(load_data())
     draw_dashboard(df_processed)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
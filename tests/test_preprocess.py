@@ -0,0 +1,74 @@
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+APP_PATH = Path(__file__).resolve().parent.parent / 'app (5).py'
+
+
+@pytest.fixture(scope='module')
+def app():
+    spec = importlib.util.spec_from_file_location('app', APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize('dtype', [object, 'string[pyarrow]'])
+@pytest.mark.parametrize(
+    'valor, esperado',
+    [
+        ('06/03/2024', pd.Timestamp(2024, 3, 6)),
+        ('2024-03-06', pd.Timestamp(2024, 3, 6)),
+        ('2024-03-06 10:00', pd.Timestamp(2024, 3, 6, 10)),
+        ('06/03/24', pd.Timestamp(2024, 3, 6)),
+    ],
+)
+def test_fecha_falla_formatos(app, valor, esperado, dtype):
+    raw = pd.DataFrame(
+        {
+            'Buque': pd.Series(['A', 'A'], dtype=dtype),
+            'Fecha Falla': pd.Series([valor, '31/12/2023'], dtype=dtype),
+        }
+    )
+    df = app.preprocess(raw)
+    assert df['fecha_falla'].iloc[0] == esperado
+    assert df['fecha_falla'].iloc[1] == pd.Timestamp(2023, 12, 31)
+
+
+def test_fecha_invalida_queda_vacia(app):
+    raw = pd.DataFrame({'Buque': ['A'], 'Fecha Falla': ['sin fecha']})
+    df = app.preprocess(raw)
+    assert pd.isna(df['fecha_falla'].iloc[0])
+    assert pd.isna(df['dias_abierto'].iloc[0])
+
+
+@pytest.mark.parametrize(
+    'content_type, content, esperado',
+    [
+        ('text/csv; charset=utf-8', b'Buque,Fecha Falla\nA,06/03/2024\n', True),
+        ('text/csv', b'Buque,Fecha Falla\n', False),
+        ('text/csv', b'', False),
+        ('text/html; charset=utf-8', b'<html><body>Acceso</body></html>', False),
+        ('text/csv', b'"sin cerrar\n', False),
+    ],
+)
+def test_is_csv_with_rows(app, content_type, content, esperado):
+    assert app.is_csv_with_rows(content_type, content) is esperado
+
+
+def test_dias_abierto_cuenta_dias_completos(app):
+    ayer = pd.Timestamp.today().normalize() - pd.Timedelta(days=1)
+    raw = pd.DataFrame(
+        {
+            'Buque': ['A', 'A', 'A'],
+            'Fecha Falla': [
+                ayer.strftime('%Y-%m-%d 18:00'),
+                ayer.strftime('%d/%m/%Y'),
+                (ayer - pd.Timedelta(days=9)).strftime('%d/%m/%Y'),
+            ],
+        }
+    )
+    df = app.preprocess(raw)
+    assert df['dias_abierto'].tolist() == [0, 1, 10]